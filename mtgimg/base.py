@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import os
+import typing as t
 from functools import lru_cache
 
 from PIL import Image
 
 from mtgimg import crop as image_crop
 from mtgimg import paths
-from mtgimg.interface import ImageFetchException, ImageLoader, SizeSlug, resize_image
+from mtgimg.interface import ImageLoader, SizeSlug, resize_image, save_image
 
 
 class BaseImageLoader(ImageLoader):
@@ -17,10 +19,52 @@ class BaseImageLoader(ImageLoader):
         SizeSlug.THUMBNAIL: paths.THUMBNAIL_CARD_BACK_PATH,
     }
 
+    def __init__(
+        self,
+        *,
+        image_cache_size: t.Optional[int] = 64,
+        disk_image_cache_size: t.Optional[int] = 16,
+        compress_level: int = 1,
+    ):
+        super().__init__(
+            image_cache_size=image_cache_size,
+            disk_image_cache_size=disk_image_cache_size,
+            compress_level=compress_level,
+        )
+        self._cardbacks = self._load_cardbacks()
+
+    @classmethod
+    def _open_cardback(cls, path: str) -> Image.Image:
+        # Held for the loader's lifetime, so these bypass the disk image cache.
+        image = Image.open(path)
+        image.load()
+        return image
+
+    def _load_cardbacks(self) -> t.Mapping[SizeSlug, Image.Image]:
+        original = self._open_cardback(self._size_cardback_path_map[SizeSlug.ORIGINAL])
+        cardbacks = {SizeSlug.ORIGINAL: original}
+
+        for size_slug, path in self._size_cardback_path_map.items():
+            if size_slug in cardbacks:
+                continue
+
+            if os.path.exists(path):
+                cardbacks[size_slug] = self._open_cardback(path)
+                continue
+
+            cardbacks[size_slug] = resize_image(original, size_slug, False)
+            try:
+                save_image(cardbacks[size_slug], path, compress_level=self._compress_level)
+            except OSError:
+                # The in memory copy is served regardless, persisting it only saves resizing on the next start.
+                pass
+
+        return cardbacks
+
     @lru_cache(maxsize=None)
     def get_default_image(self, size_slug: SizeSlug = SizeSlug.ORIGINAL, crop: bool = False) -> Image.Image:
         if crop:
-            cropped = image_crop.crop(self.load_image_from_disk(self._size_cardback_path_map[SizeSlug.ORIGINAL]))
+            cropped = image_crop.crop(self._cardbacks[SizeSlug.ORIGINAL])
             if size_slug != size_slug.ORIGINAL:
                 cropped = resize_image(
                     cropped,
@@ -29,15 +73,4 @@ class BaseImageLoader(ImageLoader):
                 )
             return cropped
 
-        try:
-            return self.load_image_from_disk(self._size_cardback_path_map[size_slug])
-        except ImageFetchException:
-            resized_back = resize_image(
-                self.load_image_from_disk(self._size_cardback_path_map[SizeSlug.ORIGINAL]),
-                size_slug,
-                False,
-            )
-            with open(self._size_cardback_path_map[size_slug], "wb") as f:
-                resized_back.save(f)
-
-            return resized_back
+        return self._cardbacks[size_slug]
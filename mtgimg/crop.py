@@ -14,10 +14,11 @@ CROPPED_SIZE = (560, 435)
 def _split_horizontal(width: int, height: int, images: t.Sequence[Image.Image]):
     offset = width // len(images)
 
-    canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    canvas = Image.new("RGBA", (width, height))
 
+    # Tiles are expected to already be one stripe wide.
     for index, image in enumerate(images):
-        canvas.paste(image.crop((0, 0, offset, height)), (index * offset, 0, (index + 1) * offset, height))
+        canvas.paste(image, (index * offset, 0))
 
     return canvas
 
@@ -26,14 +27,24 @@ def _crop_standard(image: Image.Image) -> Image.Image:
     return image.crop((92, 120, 652, 555))
 
 
+def _resize_cropped(image: Image.Image, size: t.Tuple[int, int], box: t.Tuple[int, int, int, int]) -> Image.Image:
+    # Same as image.resize(size).crop(box), but only resamples the region that is kept.
+    x_scale = image.width / size[0]
+    y_scale = image.height / size[1]
+    return image.resize(
+        (box[2] - box[0], box[3] - box[1]),
+        Image.LANCZOS,
+        box=(box[0] * x_scale, box[1] * y_scale, box[2] * x_scale, box[3] * y_scale),
+    )
+
+
 def _crop_split(image: Image.Image) -> Image.Image:
+    boxes = ((96, 82, 345, 454), (96, 582, 345, 954))
+    tile_box = (0, 0, CROPPED_SIZE[0] // len(boxes), CROPPED_SIZE[1])
     return _split_horizontal(
         CROPPED_SIZE[0],
         CROPPED_SIZE[1],
-        tuple(
-            image.crop(box).rotate(-90, expand=1).resize((650, 435), Image.LANCZOS)
-            for box in ((96, 82, 345, 454), (96, 582, 345, 954))
-        ),
+        tuple(_resize_cropped(image.crop(box).rotate(-90, expand=1), (650, 435), tile_box) for box in boxes),
     )
 
 
@@ -47,69 +58,54 @@ def _crop_aftermath(image: Image.Image) -> Image.Image:
 
     top.paste(bot.rotate(90, expand=1), (top.width // 2, 0))
 
-    return top.resize((1149, 435), Image.LANCZOS).crop((294, 0, 854, 435))
+    return _resize_cropped(top, (1149, 435), (294, 0, 854, 435))
+
+
+def _crop_sideways(image: Image.Image, box: t.Tuple[int, int, int, int]) -> Image.Image:
+    return _resize_cropped(image.crop(box).rotate(-90, expand=True), (1052, 435), (246, 0, 806, 435))
 
 
 def _crop_saga(image: Image.Image) -> Image.Image:
-    return (
-        image.crop((373, 115, 686, 872))
-        .rotate(-90, expand=True)
-        .resize((1052, 435), Image.LANCZOS)
-        .crop((246, 0, 806, 435))
-    )
+    return _crop_sideways(image, (373, 115, 686, 872))
 
 
 def _crop_room(image: Image.Image) -> Image.Image:
-    return (
-        image.crop((105, 60, 390, 936))
-        .rotate(-90, expand=True)
-        .resize((1052, 435), Image.LANCZOS)
-        .crop((246, 0, 806, 435))
-    )
+    return _crop_sideways(image, (105, 60, 390, 936))
 
 
 def _crop_class(image: Image.Image) -> Image.Image:
-    return (
-        image.crop((58, 115, 371, 872))
-        .rotate(-90, expand=True)
-        .resize((1052, 435), Image.LANCZOS)
-        .crop((246, 0, 806, 435))
-    )
+    return _crop_sideways(image, (58, 115, 371, 872))
 
 
 def _crop_battle(image: Image.Image) -> Image.Image:
-    return (
-        image.crop((103, 115, 416, 872))
-        .rotate(-90, expand=True)
-        .resize((1052, 435), Image.LANCZOS)
-        .crop((246, 0, 806, 435))
-    )
+    return _crop_sideways(image, (103, 115, 416, 872))
 
 
 def crop(image: Image.Image, image_request: t.Optional[ImageRequest] = None) -> Image.Image:
     if image_request is None or not isinstance(image_request.pictured, Printing):
         return _crop_standard(image)
 
-    layout = image_request.pictured.cardboard.layout
+    cardboard = image_request.pictured.cardboard
+    layout = cardboard.layout
 
     if layout == Layout.STANDARD:
         return _crop_standard(image)
 
-    if BATTLE in image_request.pictured.cardboard.front_card.type_line and not image_request.back:
+    type_line = cardboard.front_card.type_line
+
+    if BATTLE in type_line and not image_request.back:
         return _crop_battle(image)
 
-    if layout == Layout.SAGA or SAGA in image_request.pictured.cardboard.front_card.type_line:
+    if layout == Layout.SAGA or SAGA in type_line:
         return _crop_saga(image)
 
-    if layout == Layout.SPLIT and len(image_request.pictured.cardboard.front_cards) == 2:
-        return (
-            _crop_room(image) if ROOM in image_request.pictured.cardboard.front_card.type_line else _crop_split(image)
-        )
+    if layout == Layout.SPLIT and len(cardboard.front_cards) == 2:
+        return _crop_room(image) if ROOM in type_line else _crop_split(image)
 
     if layout == Layout.FLIP:
         return _crop_flip(image)
 
-    if layout == Layout.AFTERMATH and len(image_request.pictured.cardboard.front_cards) == 2:
+    if layout == Layout.AFTERMATH and len(cardboard.front_cards) == 2:
         return _crop_aftermath(image)
 
     if layout == Layout.CLASS:
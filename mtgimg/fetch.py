@@ -1,45 +1,89 @@
+import typing as t
+from functools import lru_cache
+from io import BytesIO
+
 import requests
 from mtgorp.models.persistent.attributes.layout import Layout
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from mtgimg.interface import ImageFetchException, ImageRequest, SizeSlug
+from mtgimg.interface import ImageFetchException, ImageRequest, InFlight, SizeSlug
 
 
-def get_scryfall_image(image_request: ImageRequest) -> Image.Image:
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    ),
+)
+
+
+_remote_card_requests: InFlight[str, t.Mapping[str, t.Any]] = InFlight()
+
+
+@lru_cache(maxsize=1024)
+def _fetch_remote_card(uri: str) -> t.Mapping[str, t.Any]:
     try:
-        remote_card_response = requests.get(image_request.remote_card_uri, timeout=32)
+        response = _session.get(uri, timeout=32)
     except Exception as e:
         raise ImageFetchException(e)
 
-    if not remote_card_response.ok:
-        raise ImageFetchException(remote_card_response.status_code)
+    if not response.ok:
+        raise ImageFetchException(response.status_code)
+
+    return response.json()
+
 
-    remote_card = remote_card_response.json()
+def get_remote_card(uri: str) -> t.Mapping[str, t.Any]:
+    # Both faces of a printing share a card uri, so the card json is cached and concurrent lookups share one request.
+    return _remote_card_requests.run(uri, lambda: _fetch_remote_card(uri))
+
+
+def get_scryfall_image_data(image_request: ImageRequest) -> bytes:
+    remote_card = get_remote_card(image_request.remote_card_uri)
 
     try:
         if image_request.pictured.cardboard.layout == Layout.MELD and image_request.back:
             for part in remote_card["all_parts"]:
                 if part["name"] == image_request.pictured.cardboard.back_card.name:
-                    remote_card = requests.get(part["uri"], timeout=32).json()
+                    remote_card = get_remote_card(part["uri"])
+                    break
 
-        image_response = requests.get(
+        image_response = _session.get(
             remote_card["card_faces"][-1 if image_request.back else 0]["image_uris"]["png"]
             if image_request.pictured.cardboard.layout in (Layout.TRANSFORM, Layout.MODAL)
             else remote_card["image_uris"]["png"],
-            stream=True,
             timeout=30,
+            # PNGs are already compressed.
+            headers={"Accept-Encoding": "identity"},
         )
 
     except Exception as e:
         raise ImageFetchException(e)
 
     if not image_response.ok:
-        raise ImageFetchException(remote_card_response.status_code)
+        raise ImageFetchException(image_response.status_code)
+
+    return image_response.content
+
 
-    fetched_image = Image.open(image_response.raw)
-    fetched_image.load()
+def decode_scryfall_image(data: bytes) -> t.Tuple[Image.Image, bool]:
+    image = Image.open(BytesIO(data))
+    image.load()
 
-    if fetched_image.size != SizeSlug.ORIGINAL.get_size():
-        fetched_image = fetched_image.resize(SizeSlug.ORIGINAL.get_size(), Image.LANCZOS)
+    width, height = image.size
+    target_width, target_height = SizeSlug.ORIGINAL.get_size()
 
-    return fetched_image
+    # Tolerate off by one drift in the served dimensions rather than paying for a full resample.
+    if abs(width - target_width) > 1 or abs(height - target_height) > 1:
+        return image.resize((target_width, target_height), Image.LANCZOS, reducing_gap=2.0), True
+
+    return image, False
+
+
+def get_scryfall_image(image_request: ImageRequest) -> Image.Image:
+    return decode_scryfall_image(get_scryfall_image_data(image_request))[0]
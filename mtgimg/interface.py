@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import copy
 import os
+import threading
 import typing as t
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
 from enum import Enum
 from functools import lru_cache
 
@@ -29,8 +31,8 @@ class SizeSlug(Enum):
     def scale(self) -> float:
         return self._scale
 
-    def get_size(self, cropped: bool = False):
-        return IMAGE_SIZE_MAP[frozenset((self, cropped))]
+    def get_size(self, cropped: bool = False) -> t.Tuple[int, int]:
+        return IMAGE_SIZE_MAP[(self, cropped)]
 
     def __new__(cls, code, scale):
         obj = object.__new__(cls)
@@ -40,21 +42,21 @@ class SizeSlug(Enum):
 
 
 IMAGE_SIZE_MAP = {
-    frozenset((SizeSlug.ORIGINAL, False)): (745, 1040),
-    frozenset((SizeSlug.ORIGINAL, True)): (560, 435),
+    (SizeSlug.ORIGINAL, False): (745, 1040),
+    (SizeSlug.ORIGINAL, True): (560, 435),
 }
 
 IMAGE_SIZE_MAP.update(
     {
-        frozenset((size_slug, crop)): tuple(
-            int(dimension * size_slug.scale) for dimension in IMAGE_SIZE_MAP[frozenset((SizeSlug.ORIGINAL, crop))]
+        (size_slug, crop): tuple(
+            int(dimension * size_slug.scale) for dimension in IMAGE_SIZE_MAP[(SizeSlug.ORIGINAL, crop)]
         )
         for size_slug in SizeSlug
         for crop in (True, False)
     }
 )
 
-IMAGE_SIZE_MAP: t.Mapping[t.FrozenSet[t.Union[SizeSlug, bool]], t.Tuple[int, int]] = immutabledict(IMAGE_SIZE_MAP)
+IMAGE_SIZE_MAP: t.Mapping[t.Tuple[SizeSlug, bool], t.Tuple[int, int]] = immutabledict(IMAGE_SIZE_MAP)
 
 
 class ImageFetchException(Exception):
@@ -94,6 +96,26 @@ pictureable = t.Union[Imageable, Printing]
 
 
 class ImageRequest(object):
+    __slots__ = (
+        "_pictured",
+        "_pictured_type",
+        "_pictured_name",
+        "_back",
+        "_crop",
+        "_size_slug",
+        "_save",
+        "_cache_only",
+        "_allow_disk_cached",
+        "_key",
+        "_hash",
+        "_cached_has_image",
+        "_cached_identifier",
+        "_cached_name",
+        "_cached_dir_path",
+        "_cached_path",
+        "_cached_remote_card_uri",
+    )
+
     def __init__(
         self,
         pictured: t.Optional[pictureable] = None,
@@ -116,9 +138,33 @@ class ImageRequest(object):
         self._save = save
         self._cache_only = cache_only
         self._allow_disk_cached = allow_disk_cached
+        self._key = (
+            self._pictured,
+            self._pictured_type,
+            self._pictured_name,
+            self._back,
+            self._crop,
+            self._size_slug,
+            self._save,
+            self._cache_only,
+            self._allow_disk_cached,
+        )
+        self._hash = hash(self._key)
+
+        self._cached_has_image = None
+        self._cached_identifier = None
+        self._cached_name = None
+        self._cached_dir_path = None
+        self._cached_path = None
+        self._cached_remote_card_uri = None
 
     @property
     def has_image(self) -> bool:
+        if self._cached_has_image is None:
+            self._cached_has_image = self._get_has_image()
+        return self._cached_has_image
+
+    def _get_has_image(self) -> bool:
         if self._pictured_name is not None:
             return True
 
@@ -134,22 +180,27 @@ class ImageRequest(object):
 
     @property
     def _identifier(self) -> str:
-        if self._pictured_name is not None:
-            return self._pictured_name
-
-        return self._pictured.get_image_name() if isinstance(self._pictured, Imageable) else str(self._pictured.id)
+        if self._cached_identifier is None:
+            if self._pictured_name is not None:
+                self._cached_identifier = self._pictured_name
+            elif isinstance(self._pictured, Imageable):
+                self._cached_identifier = self._pictured.get_image_name()
+            else:
+                self._cached_identifier = str(self._pictured.id)
+        return self._cached_identifier
 
     @property
     def _name_no_extension(self) -> str:
-        return (
-            (self._identifier + ("_b" if self._back else "") if self.has_image else "cardback")
-            + ("_crop" if self._crop else "")
-            + ("_" + self._size_slug.code if self.size_slug.code else "")
-        )
+        base = (self._identifier + "_b" if self._back else self._identifier) if self.has_image else "cardback"
+        crop = "_crop" if self._crop else ""
+        size = "_" + self._size_slug.code if self._size_slug.code else ""
+        return f"{base}{crop}{size}"
 
     @property
     def name(self) -> str:
-        return self._name_no_extension + "." + self.extension
+        if self._cached_name is None:
+            self._cached_name = self._name_no_extension + "." + self.extension
+        return self._cached_name
 
     @property
     def extension(self) -> str:
@@ -164,6 +215,11 @@ class ImageRequest(object):
 
     @property
     def dir_path(self) -> str:
+        if self._cached_dir_path is None:
+            self._cached_dir_path = self._get_dir_path()
+        return self._cached_dir_path
+
+    def _get_dir_path(self) -> str:
         if self._pictured_name is not None:
             if issubclass(self._pictured_type, Imageable):
                 return self._get_imageable_dir_path(self._pictured_type)
@@ -178,14 +234,18 @@ class ImageRequest(object):
 
     @property
     def path(self) -> str:
-        return os.path.join(
-            self.dir_path,
-            self.name,
-        )
+        if self._cached_path is None:
+            self._cached_path = os.path.join(
+                self.dir_path,
+                self.name,
+            )
+        return self._cached_path
 
     @property
     def remote_card_uri(self) -> str:
-        return f"https://api.scryfall.com/cards/multiverse/{self.pictured.id}"
+        if self._cached_remote_card_uri is None:
+            self._cached_remote_card_uri = f"https://api.scryfall.com/cards/multiverse/{self._pictured.id}"
+        return self._cached_remote_card_uri
 
     @property
     def pictured(self) -> pictureable:
@@ -205,7 +265,7 @@ class ImageRequest(object):
 
     @property
     def size(self) -> t.Tuple[int, int]:
-        return IMAGE_SIZE_MAP[frozenset((self._size_slug, self._crop))]
+        return IMAGE_SIZE_MAP[(self._size_slug, self._crop)]
 
     @property
     def save(self) -> bool:
@@ -228,38 +288,42 @@ class ImageRequest(object):
         return self._pictured_type
 
     def spawn(self, **kwargs) -> ImageRequest:
-        _image_request = copy.copy(self)
-        _image_request.__dict__.update({"_" + key: value for key, value in kwargs.items()})
-        return _image_request
+        values = {
+            "pictured": self._pictured,
+            "pictured_type": self._pictured_type,
+            "picture_name": self._pictured_name,
+            "back": self._back,
+            "crop": self._crop,
+            "size_slug": self._size_slug,
+            "save": self._save,
+            "cache_only": self._cache_only,
+            "allow_disk_cached": self._allow_disk_cached,
+        }
+
+        # Overrides are also accepted by attribute name, where the picture name is stored as _pictured_name.
+        if "pictured_name" in kwargs:
+            kwargs["picture_name"] = kwargs.pop("pictured_name")
+
+        # Requests are immutable, so one that would not change can be shared instead of rebuilt.
+        if all(key in values and values[key] == value for key, value in kwargs.items()):
+            return self
+
+        spawned = self.__class__(**{**values, **kwargs})
+
+        # Derived values that only depend on what is pictured carry over to siblings, such as crops and resizes.
+        if spawned._pictured is self._pictured and spawned._pictured_name == self._pictured_name:
+            spawned._cached_identifier = self._cached_identifier
+            if spawned._back == self._back and spawned._pictured_type is self._pictured_type:
+                spawned._cached_has_image = self._cached_has_image
+                spawned._cached_dir_path = self._cached_dir_path
+
+        return spawned
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                self._pictured,
-                self._pictured_type,
-                self._pictured_name,
-                self._back,
-                self._crop,
-                self._size_slug,
-                self._save,
-                self._cache_only,
-                self._allow_disk_cached,
-            )
-        )
+        return self._hash
 
     def __eq__(self, other) -> bool:
-        return (
-            isinstance(other, self.__class__)
-            and self._pictured == other._pictured
-            and self._pictured_type == other._pictured_type
-            and self._pictured_name == other._pictured_name
-            and self._back == other._back
-            and self._crop == other._crop
-            and self._size_slug == other._size_slug
-            and self._save == other._save
-            and self._cache_only == other._cache_only
-            and self._allow_disk_cached == other._allow_disk_cached
-        )
+        return self is other or (isinstance(other, self.__class__) and self._key == other._key)
 
     @property
     def flags(self) -> t.Iterator[str]:
@@ -283,17 +347,127 @@ class ImageRequest(object):
         )
 
 
+_RESAMPLE_MAP: t.Mapping[SizeSlug, int] = immutabledict(
+    {
+        SizeSlug.ORIGINAL: Image.LANCZOS,
+        SizeSlug.MEDIUM: Image.LANCZOS,
+        SizeSlug.SMALL: Image.BILINEAR,
+        SizeSlug.THUMBNAIL: Image.BOX,
+    }
+)
+
+
 def resize_image(image: Image.Image, size_slug: SizeSlug, crop: bool = False) -> Image.Image:
-    return image.resize(
-        size_slug.get_size(crop),
-        Image.LANCZOS,
+    return image.resize(size_slug.get_size(crop), _RESAMPLE_MAP[size_slug], reducing_gap=3.0)
+
+
+def _write_atomic(path: str, write: t.Callable[[str], None]) -> None:
+    # Written next to the target and renamed into place, so an interrupted write never leaves a truncated cache entry.
+    temp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_image(image: Image.Image, path: str, extension: str = "png", compress_level: int = 1) -> None:
+    # Cached images are read far more often than they are written, so by default favor encode speed over file size.
+    _write_atomic(
+        path, lambda temp_path: image.save(temp_path, extension, compress_level=compress_level, optimize=False)
     )
 
 
+def save_data(data: bytes, path: str) -> None:
+    def _write(temp_path: str) -> None:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+
+    _write_atomic(path, _write)
+
+
+K = t.TypeVar("K")
+V = t.TypeVar("V")
+
+
+class InFlight(t.Generic[K, V]):
+    def __init__(self):
+        self._futures: t.Dict[K, Future[V]] = {}
+        self._lock = threading.Lock()
+
+    def get_future(self, key: K) -> t.Tuple[Future[V], bool]:
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future, True
+
+            future = self._futures[key] = Future()
+            future.add_done_callback(lambda _: self._remove(key))
+            return future, False
+
+    def _remove(self, key: K) -> None:
+        with self._lock:
+            del self._futures[key]
+
+    def run(self, key: K, task: t.Callable[[], V]) -> V:
+        future, in_progress = self.get_future(key)
+
+        if in_progress:
+            return future.result()
+
+        try:
+            result = task()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+
+        future.set_result(result)
+        return result
+
+
+class ImageCache(object):
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._images: t.OrderedDict[t.Hashable, Image.Image] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: t.Hashable) -> t.Optional[Image.Image]:
+        # Copies are made under the lock, so an image can't be closed by an eviction while it is being copied.
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                return None
+            self._images.move_to_end(key)
+            return image.copy()
+
+    def put(self, key: t.Hashable, image: Image.Image) -> None:
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self._max_size:
+                self._images.popitem(last=False)[1].close()
+
+
 class ImageLoader(ABC):
-    def __init__(self, *, image_cache_size: t.Optional[int] = 64):
+    def __init__(
+        self,
+        *,
+        image_cache_size: t.Optional[int] = 64,
+        disk_image_cache_size: t.Optional[int] = 16,
+        compress_level: int = 1,
+    ):
+        self._compress_level = compress_level
         if image_cache_size is not None:
             self._get_image = lru_cache(image_cache_size)(self._get_image)
+        self._disk_image_cache = None if disk_image_cache_size is None else ImageCache(disk_image_cache_size)
+
+    @property
+    def compress_level(self) -> int:
+        return self._compress_level
 
     @abstractmethod
     def _get_image(
@@ -332,14 +506,59 @@ class ImageLoader(ABC):
             else image_request
         )
 
+    def get_images(self, image_requests: t.Iterable[ImageRequest]) -> Promise[t.List[Image.Image]]:
+        # Duplicate requests share one promise, so each distinct image is dispatched once.
+        promises: t.Dict[ImageRequest, Promise[Image.Image]] = {}
+        ordered = []
+        for image_request in image_requests:
+            if image_request not in promises:
+                promises[image_request] = self._get_image(image_request)
+            ordered.append(promises[image_request])
+        return Promise.all(ordered)
+
+    @classmethod
+    def _get_disk_cache_key(cls, path: str) -> t.Tuple[int, int, int]:
+        stat = os.stat(path)
+        return stat.st_dev, stat.st_ino, stat.st_mtime_ns
+
+    def get_cached_image_from_disk(self, path: str) -> t.Optional[Image.Image]:
+        # Only answers from already decoded images, so it is cheap enough to call without going through an executor.
+        if self._disk_image_cache is None:
+            return None
+        try:
+            return self._disk_image_cache.get(self._get_disk_cache_key(path))
+        except OSError:
+            return None
+
+    def get_cached_image(self, image_request: ImageRequest) -> t.Optional[Image.Image]:
+        if not image_request.allow_disk_cached or image_request.cache_only:
+            return None
+        return self.get_cached_image_from_disk(image_request.path)
+
     def load_image_from_disk(self, path: str) -> Image.Image:
+        # Decoded images are cached by file identity and modification time, so aliased paths share an entry and
+        # files rewritten on disk are decoded again. Callers get their own copy, as the cached image is shared.
+        try:
+            key = self._get_disk_cache_key(path)
+        except OSError as e:
+            raise ImageFetchException(e)
+
+        if self._disk_image_cache is not None:
+            image = self._disk_image_cache.get(key)
+            if image is not None:
+                return image
+
         try:
             image = Image.open(path)
             image.load()
-            return image
         except Exception as e:
             raise ImageFetchException(e)
 
+        if self._disk_image_cache is not None:
+            self._disk_image_cache.put(key, image.copy())
+
+        return image
+
     @abstractmethod
     def get_default_image(self, size_slug: SizeSlug = SizeSlug.ORIGINAL, crop: bool = False) -> Image.Image:
         pass
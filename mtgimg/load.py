@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import typing as t
-from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 from PIL import Image
 from promise import Promise
 
 from mtgimg import pipeline
 from mtgimg.base import BaseImageLoader
-from mtgimg.interface import Imageable, ImageRequest
+from mtgimg.interface import Imageable, ImageRequest, InFlight
 
 
 class Loader(BaseImageLoader):
@@ -18,34 +18,81 @@ class Loader(BaseImageLoader):
         imageable_executor: t.Union[Executor, int] = None,
         *,
         image_cache_size: t.Optional[int] = 64,
+        disk_image_cache_size: t.Optional[int] = 16,
+        compress_level: int = 1,
     ):
-        super().__init__(image_cache_size=image_cache_size)
+        super().__init__(
+            image_cache_size=image_cache_size,
+            disk_image_cache_size=disk_image_cache_size,
+            compress_level=compress_level,
+        )
 
+        self._owns_printings_executor = not isinstance(printing_executor, Executor)
         self._printings_executor = (
-            printing_executor
-            if isinstance(printing_executor, Executor)
-            else ThreadPoolExecutor(max_workers=printing_executor if isinstance(printing_executor, int) else 8)
+            ThreadPoolExecutor(max_workers=printing_executor if isinstance(printing_executor, int) else 8)
+            if self._owns_printings_executor
+            else printing_executor
         )
 
+        self._owns_imageables_executor = not isinstance(imageable_executor, Executor)
         self._imageables_executor = (
-            imageable_executor
-            if isinstance(imageable_executor, Executor)
-            else ThreadPoolExecutor(max_workers=imageable_executor if isinstance(imageable_executor, int) else 4)
+            ThreadPoolExecutor(max_workers=imageable_executor if isinstance(imageable_executor, int) else 4)
+            if self._owns_imageables_executor
+            else imageable_executor
         )
 
+        self._in_flight: InFlight[ImageRequest, Image.Image] = InFlight()
+
+    def _resolve(self, future: Future[Image.Image], image_request: ImageRequest) -> None:
+        try:
+            future.set_result(pipeline.get_pipeline(image_request).get_image(image_request, self))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def get_future(self, image_request: ImageRequest) -> Future[Image.Image]:
+        image = self.get_cached_image(image_request)
+        if image is not None:
+            future = Future()
+            future.set_result(image)
+            return future
+
+        shared_future, in_progress = self._in_flight.get_future(image_request)
+
+        if not in_progress:
+            try:
+                (
+                    self._imageables_executor
+                    if isinstance(image_request.pictured, Imageable)
+                    else self._printings_executor
+                ).submit(
+                    self._resolve,
+                    shared_future,
+                    image_request,
+                )
+            except BaseException as e:
+                shared_future.set_exception(e)
+                raise
+
+        future = Future()
+        shared_future.add_done_callback(lambda done: self._copy_outcome(done, future))
+        return future
+
+    @staticmethod
+    def _copy_outcome(source: Future[Image.Image], target: Future[Image.Image]) -> None:
+        if not target.set_running_or_notify_cancel():
+            return
+
+        exception = source.exception()
+        if exception is None:
+            target.set_result(source.result())
+        else:
+            target.set_exception(exception)
+
     def _get_image(self, image_request: ImageRequest = None) -> Promise[Image.Image]:
-        return Promise.resolve(
-            (
-                self._imageables_executor
-                if isinstance(image_request.pictured, Imageable)
-                else self._printings_executor
-            ).submit(
-                pipeline.get_pipeline(image_request).get_image,
-                image_request,
-                self,
-            )
-        )
+        return Promise.resolve(self.get_future(image_request))
 
     def stop(self) -> None:
-        self._imageables_executor.shutdown(wait=False)
-        self._printings_executor.shutdown(wait=False)
+        if self._owns_imageables_executor:
+            self._imageables_executor.shutdown(wait=False)
+        if self._owns_printings_executor:
+            self._printings_executor.shutdown(wait=False)
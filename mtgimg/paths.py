@@ -5,11 +5,21 @@ from appdirs import AppDirs
 
 APP_DATA_PATH = AppDirs("mtgimg", "mtgimg").user_data_dir
 
-try:
-    with open(os.path.join(APP_DATA_PATH, "imagepath.txt"), "r") as f:
-        IMAGES_PATH = f.read().strip()
-except FileNotFoundError:
-    IMAGES_PATH = os.path.join(APP_DATA_PATH, "images")
+
+def _get_images_path() -> str:
+    try:
+        with open(os.path.join(APP_DATA_PATH, "imagepath.txt"), "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return os.path.join(APP_DATA_PATH, "images")
+
+
+def __getattr__(name: str) -> str:
+    if name == "IMAGES_PATH":
+        images_path = globals()["IMAGES_PATH"] = _get_images_path()
+        return images_path
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 CARD_BACK_DIRECTORY_PATH = os.path.join(
     os.path.dirname(os.path.realpath(__file__)),
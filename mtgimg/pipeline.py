@@ -5,36 +5,48 @@ import typing as t
 from abc import ABC, abstractmethod
 
 from PIL import Image
-from yeetlong.taskawaiter import EventWithValue, TaskAwaiter
 
 from mtgimg import crop as image_crop
-from mtgimg.fetch import get_scryfall_image
+from mtgimg.fetch import decode_scryfall_image, get_scryfall_image_data
 from mtgimg.interface import (
     Imageable,
     ImageFetchException,
     ImageLoader,
     ImageRequest,
+    InFlight,
     SizeSlug,
     resize_image,
+    save_data,
+    save_image,
 )
 
 
+_known_dirs: t.Set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    if path not in _known_dirs:
+        os.makedirs(path, exist_ok=True)
+        _known_dirs.add(path)
+
+
 class ImageSource(ABC):
     @abstractmethod
     def get_image(self, image_request: ImageRequest, loader: ImageLoader) -> Image.Image:
         pass
 
 
-class ImageableProcessor(ImageSource):
-    _processing: TaskAwaiter[ImageRequest, Image.Image] = TaskAwaiter()
+# In flight work for every pipeline stage, keyed by the stage class and the request it is producing.
+_tasks: InFlight[t.Tuple[t.Type[ImageSource], ImageRequest], t.Optional[Image.Image]] = InFlight()
 
+
+class ImageableProcessor(ImageSource):
     @classmethod
     def get_imageable_image(
         cls,
         image_request: ImageRequest,
         size: t.Tuple[int, int],
         loader: ImageLoader,
-        event: EventWithValue[ImageRequest, Image.Image],
     ) -> t.Optional[Image.Image]:
         image = image_request.pictured.get_image(
             size,
@@ -43,20 +55,20 @@ class ImageableProcessor(ImageSource):
             image_request.crop,
         )
 
+        if image_request.cache_only and not image_request.save:
+            return None
+
         if image.size != size:
             image = image.resize(size, Image.LANCZOS)
 
         if image_request.save:
-            if not os.path.exists(image_request.dir_path):
-                os.makedirs(image_request.dir_path)
+            _ensure_dir(image_request.dir_path)
 
-            image.save(image_request.path)
+            save_image(image, image_request.path, image_request.extension, loader.compress_level)
 
         if image_request.cache_only:
-            event.set_value(None)
-            return
+            return None
 
-        event.set_value(image)
         return image
 
     @classmethod
@@ -73,39 +85,31 @@ class ImageableProcessor(ImageSource):
         elif image_request.cache_only:
             return None
 
-        event, in_progress = cls._processing.get_condition(image_request)
-
-        if in_progress:
-            event.wait()
-            return event.value
-
-        return cls.get_imageable_image(
-            image_request,
-            image_request.size_slug.get_size(image_request.crop),
-            loader,
-            event,
+        return _tasks.run(
+            (cls, image_request),
+            lambda: cls.get_imageable_image(
+                image_request,
+                image_request.size_slug.get_size(image_request.crop),
+                loader,
+            ),
         )
 
 
 class Fetcher(ImageSource):
-    _fetching: TaskAwaiter[ImageRequest, Image.Image] = TaskAwaiter()
-
     @classmethod
-    def _fetch_image(cls, event: EventWithValue[ImageRequest, Image.Image], image_request: ImageRequest):
-        with event:
-            fetched_image = get_scryfall_image(image_request)
+    def _fetch_image(cls, image_request: ImageRequest, loader: ImageLoader) -> Image.Image:
+        data = get_scryfall_image_data(image_request)
+        fetched_image, resized = decode_scryfall_image(data)
 
-            if image_request.save:
-                if not os.path.exists(image_request.dir_path):
-                    os.makedirs(image_request.dir_path)
-                fetched_image.save(
-                    image_request.path,
-                    image_request.extension,
-                )
-
-            event.set_value(fetched_image)
+        if image_request.save:
+            _ensure_dir(image_request.dir_path)
+            if resized:
+                save_image(fetched_image, image_request.path, image_request.extension, loader.compress_level)
+            else:
+                # The served PNG is already at the stored size, so write it as is instead of re-encoding it.
+                save_data(data, image_request.path)
 
-            return fetched_image
+        return fetched_image
 
     @classmethod
     def get_image(cls, image_request: ImageRequest, loader: ImageLoader) -> Image.Image:
@@ -118,18 +122,10 @@ class Fetcher(ImageSource):
                 elif not image_request.has_image:
                     raise ImageFetchException("Missing default image")
 
-        event, in_progress = cls._fetching.get_condition(image_request)
-
-        if in_progress:
-            event.wait()
-            return event.value
-
-        return cls._fetch_image(event, image_request)
+        return _tasks.run((cls, image_request), lambda: cls._fetch_image(image_request, loader))
 
 
 class ImageTransformer(ImageSource):
-    _tasks: TaskAwaiter[ImageRequest, Image.Image] = None
-
     def __init__(self, source: t.Union[ImageSource, t.Type[ImageSource]]):
         self._source = source
 
@@ -148,39 +144,30 @@ class ImageTransformer(ImageSource):
             except ImageFetchException:
                 pass
 
-        event, in_progress = self._tasks.get_condition(image_request)
-
-        if in_progress:
-            event.wait()
-            return event.value
-
-        with event:
-            source_image = self._source.get_image(
-                self._spawn_image_request(image_request),
-                loader,
-            )
+        return _tasks.run((self.__class__, image_request), lambda: self._transform_image(image_request, loader))
 
-            processed_image = self._process_image(
-                source_image,
-                image_request,
-            )
+    def _transform_image(self, image_request: ImageRequest, loader: ImageLoader) -> Image.Image:
+        source_image = self._source.get_image(
+            self._spawn_image_request(image_request),
+            loader,
+        )
 
-            if image_request.save:
-                if not os.path.exists(image_request.dir_path):
-                    os.makedirs(image_request.dir_path)
-                processed_image.save(image_request.path, image_request.extension)
+        processed_image = self._process_image(
+            source_image,
+            image_request,
+        )
 
-            event.set_value(processed_image)
+        if image_request.save:
+            _ensure_dir(image_request.dir_path)
+            save_image(processed_image, image_request.path, image_request.extension, loader.compress_level)
 
-            return processed_image
+        return processed_image
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._source})"
 
 
 class Cropper(ImageTransformer):
-    _tasks = TaskAwaiter()
-
     def _process_image(self, image: Image.Image, image_request: ImageRequest) -> Image.Image:
         return image_crop.crop(image, image_request)
 
@@ -189,8 +176,6 @@ class Cropper(ImageTransformer):
 
 
 class ReSizer(ImageTransformer):
-    _tasks = TaskAwaiter()
-
     def _process_image(self, image: Image.Image, image_request: ImageRequest) -> Image.Image:
         return resize_image(image=image, size_slug=image_request.size_slug, crop=image_request.crop)
 